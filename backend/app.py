@@ -4,10 +4,18 @@ Main application entry point
 """
 from flask import Flask, jsonify
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
 from src.config.settings import config
 from src.config.database import db
+from src.services.group_commit import group_committer
+from src.services.idempotency import idempotency_store
+from src.services.admission import admission
+from src.services.jobs import job_runner
+from src.services.profiler import profiler
 from src.controllers.medicine import medicine_bp
 from src.controllers.company import company_bp
+from src.controllers.admin import admin_bp
+from src.controllers.job import job_bp
 
 
 def create_app():
@@ -18,13 +26,24 @@ def create_app():
     # Load configuration
     app.config.from_object(config)
     
+    # Trust X-Forwarded-For from the reverse proxy (so remote_addr is the client)
+    if config.PROXY_FIX_X_FOR:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=config.PROXY_FIX_X_FOR)
+    
     # Initialize extensions
     db.init_app(app)
+    group_committer.init_app(app)
+    idempotency_store.init_app(app)
+    admission.init_app(app)
+    job_runner.init_app(app)
+    profiler.init_app(app)
     CORS(app, origins=config.CORS_ORIGINS)
     
     # Register blueprints (routes)
     app.register_blueprint(medicine_bp)
     app.register_blueprint(company_bp)
+    app.register_blueprint(admin_bp)
+    app.register_blueprint(job_bp)
     
     # Error handlers
     @app.errorhandler(404)
@@ -84,6 +103,7 @@ if __name__ == '__main__':
     print(f"Server: http://localhost:{port}")
     print(f"Medicines API: http://localhost:{port}/api/medicines")
     print(f"Companies API: http://localhost:{port}/api/companies")
+    print(f"Jobs API: http://localhost:{port}/api/jobs")
     print("="*60 + "\n")
     
     app.run(debug=config.DEBUG, port=port)
@@ -0,0 +1,88 @@
+"""
+Benchmark: per-request commits vs group commit for concurrent medicine creates
+
+Usage (from the backend folder):
+    python benchmarks/group_commit.py [--threads 16] [--requests 50]
+
+Each mode runs in a fresh subprocess against its own temporary SQLite file,
+so the app factory picks up GROUP_COMMIT from the environment.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_worker(threads, requests_per_thread):
+    """Fire concurrent POST /api/medicines calls and print requests/second"""
+    sys.path.insert(0, BACKEND_DIR)
+    from app import app
+
+    errors = []
+
+    def client_loop(worker):
+        client = app.test_client()
+        for i in range(requests_per_thread):
+            response = client.post('/api/medicines', json={
+                'name': f'Bench {worker}-{i}',
+                'price': 1.5,
+                'stock': i,
+                'company_id': 1,
+            })
+            if response.status_code != 201:
+                errors.append(response.status_code)
+
+    workers = [threading.Thread(target=client_loop, args=(w,)) for w in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    total = threads * requests_per_thread
+    print(f'{total / elapsed:.1f} {elapsed:.3f} {len(errors)}')
+
+
+def run_mode(group_commit, threads, requests_per_thread):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env['DATABASE_URI'] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        env['GROUP_COMMIT'] = 'true' if group_commit else 'false'
+        output = subprocess.run(
+            [sys.executable, __file__, '--worker',
+             '--threads', str(threads), '--requests', str(requests_per_thread)],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+    rate, elapsed, errors = output.strip().splitlines()[-1].split()
+    return float(rate), float(elapsed), int(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.threads, args.requests)
+        return
+
+    total = args.threads * args.requests
+    print(f'{total} creates from {args.threads} threads')
+    baseline = None
+    for label, group_commit in (('per-request commit', False), ('group commit', True)):
+        rate, elapsed, errors = run_mode(group_commit, args.threads, args.requests)
+        baseline = baseline or rate
+        print(f'  {label:<20} {rate:8.1f} req/s  {elapsed:6.2f}s  '
+              f'errors={errors}  x{rate / baseline:.2f}')
+
+
+if __name__ == '__main__':
+    main()
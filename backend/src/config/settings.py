@@ -20,6 +20,55 @@ class Config:
     # Server settings
     PORT = int(os.getenv('PORT', 3001))
     DEBUG = os.getenv('FLASK_ENV', 'development') == 'development'
+    
+    # Group commit: coalesce concurrent medicine creates/updates into one transaction
+    GROUP_COMMIT = os.getenv('GROUP_COMMIT', 'false').lower() == 'true'
+    GROUP_COMMIT_WINDOW_MS = int(os.getenv('GROUP_COMMIT_WINDOW_MS', 5))
+    GROUP_COMMIT_MAX_BATCH = int(os.getenv('GROUP_COMMIT_MAX_BATCH', 64))
+    GROUP_COMMIT_TIMEOUT_SECONDS = float(os.getenv('GROUP_COMMIT_TIMEOUT_SECONDS', 30))
+    
+    # Idempotency keys for create endpoints
+    IDEMPOTENCY_TTL_SECONDS = int(os.getenv('IDEMPOTENCY_TTL_SECONDS', 86400))
+    IDEMPOTENCY_PENDING_TIMEOUT_SECONDS = int(os.getenv('IDEMPOTENCY_PENDING_TIMEOUT_SECONDS', 60))
+    IDEMPOTENCY_CACHE_SIZE = int(os.getenv('IDEMPOTENCY_CACHE_SIZE', 1024))
+    
+    # Reverse proxy: number of trusted X-Forwarded-For hops (0 = not behind a proxy)
+    PROXY_FIX_X_FOR = int(os.getenv('PROXY_FIX_X_FOR', 0))
+    
+    # Admission control: per-route concurrency caps and per-client token buckets
+    ADMISSION_CONTROL = os.getenv('ADMISSION_CONTROL', 'false').lower() == 'true'
+    ADMISSION_MAX_CLIENTS = int(os.getenv('ADMISSION_MAX_CLIENTS', 10000))
+    ADMISSION_CLASSES = {
+        # Cheap point lookups (tills): high rate, no concurrency cap
+        'point': {
+            'concurrency': None,
+            'rate': float(os.getenv('ADMISSION_POINT_RATE', 50)),
+            'burst': int(os.getenv('ADMISSION_POINT_BURST', 100)),
+        },
+        # Multi-get by ID (cart/till screens): own pool, never behind scans
+        'batch': {
+            'concurrency': None,
+            'rate': float(os.getenv('ADMISSION_BATCH_RATE', 20)),
+            'burst': int(os.getenv('ADMISSION_BATCH_BURST', 40)),
+        },
+        # Full scans and LIKE searches: capped so they cannot take every worker
+        'scan': {
+            'concurrency': int(os.getenv('ADMISSION_SCAN_CONCURRENCY', 4)),
+            'rate': float(os.getenv('ADMISSION_SCAN_RATE', 5)),
+            'burst': int(os.getenv('ADMISSION_SCAN_BURST', 10)),
+        },
+    }
+    
+    # Background jobs
+    JOBS_MAX_WORKERS = int(os.getenv('JOBS_MAX_WORKERS', 2))
+    JOBS_MAX_PENDING = int(os.getenv('JOBS_MAX_PENDING', 100))
+    
+    # Per-request profiling (off unless PROFILING=true)
+    PROFILING = os.getenv('PROFILING', 'false').lower() == 'true'
+    PROFILING_TOKEN = os.getenv('PROFILING_TOKEN', '')
+    PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', 0))
+    PROFILING_DIR = os.getenv('PROFILING_DIR')  # default: <instance>/profiles
+    PROFILING_MAX_FILES = int(os.getenv('PROFILING_MAX_FILES', 50))
 
 
 # Export the config to use
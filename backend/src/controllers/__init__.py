@@ -3,5 +3,8 @@ Controllers package
 """
 from .medicine import MedicineController, medicine_bp
 from .company import CompanyController, company_bp
+from .admin import AdminController, admin_bp
+from .job import JobController, job_bp
 
-__all__ = ['MedicineController', 'medicine_bp', 'CompanyController', 'company_bp']
+__all__ = ['MedicineController', 'medicine_bp', 'CompanyController', 'company_bp',
+           'AdminController', 'admin_bp', 'JobController', 'job_bp']
@@ -0,0 +1,7 @@
+"""
+Admin controller package
+"""
+from .admin_controller import AdminController
+from .admin_routes import admin_bp
+
+__all__ = ['AdminController', 'admin_bp']
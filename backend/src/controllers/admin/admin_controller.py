@@ -0,0 +1,33 @@
+"""
+Admin Controller - Operational endpoints (load shedding counters, saved profiles)
+"""
+from flask import jsonify, send_from_directory
+from src.services.admission import admission
+from src.services.profiler import profiler
+
+
+class AdminController:
+    """Controller for operational/diagnostic endpoints"""
+
+    @staticmethod
+    def admission_stats():
+        """Admitted, shed and in-flight request counters per route"""
+        return jsonify(admission.stats()), 200
+
+    @staticmethod
+    def get_profiles():
+        """List saved request profiles (requires the profiling token)"""
+        if not profiler.enabled:
+            return jsonify({'error': 'Profiling is disabled'}), 404
+        if not profiler.is_authorized():
+            return jsonify({'error': 'Forbidden'}), 403
+        return jsonify(profiler.list_profiles()), 200
+
+    @staticmethod
+    def get_profile(name):
+        """Download a saved pstats file (requires the profiling token)"""
+        if not profiler.enabled:
+            return jsonify({'error': 'Profiling is disabled'}), 404
+        if not profiler.is_authorized():
+            return jsonify({'error': 'Forbidden'}), 403
+        return send_from_directory(profiler.directory, name, as_attachment=True)
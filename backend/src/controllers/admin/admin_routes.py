@@ -0,0 +1,13 @@
+"""
+Admin Routes
+"""
+from flask import Blueprint
+from .admin_controller import AdminController
+
+# Create blueprint
+admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
+
+# Routes
+admin_bp.route('/admission', methods=['GET'])(AdminController.admission_stats)
+admin_bp.route('/profiles', methods=['GET'])(AdminController.get_profiles)
+admin_bp.route('/profiles/<path:name>', methods=['GET'])(AdminController.get_profile)
@@ -4,6 +4,7 @@ Company Controller - Handles all company-related business logic
 from flask import request, jsonify
 from src.models.company import Company
 from src.config.database import db
+from src.services.fieldsets import requested_fields, project
 
 
 class CompanyController:
@@ -12,8 +13,13 @@ class CompanyController:
     @staticmethod
     def get_all():
         """Get all companies"""
-        companies = Company.query.order_by(Company.name).all()
-        return jsonify([c.to_dict() for c in companies]), 200
+        try:
+            fields = requested_fields(Company)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        companies = project(Company.query, Company, fields).order_by(Company.name).all()
+        return jsonify([c.to_dict(fields) for c in companies]), 200
 
     @staticmethod
     def create():
@@ -55,8 +61,13 @@ class CompanyController:
     @staticmethod
     def get_by_id(company_id):
         """Get a single company by ID"""
-        company = Company.query.get_or_404(company_id)
-        return jsonify(company.to_dict()), 200
+        try:
+            fields = requested_fields(Company)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        company = project(Company.query, Company, fields).get_or_404(company_id)
+        return jsonify(company.to_dict(fields)), 200
 
     @staticmethod
     def update(company_id):
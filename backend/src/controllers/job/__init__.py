@@ -0,0 +1,7 @@
+"""
+Job controller package
+"""
+from .job_controller import JobController
+from .job_routes import job_bp
+
+__all__ = ['JobController', 'job_bp']
@@ -0,0 +1,52 @@
+"""
+Job Controller - Submits background jobs and reports their status
+"""
+from flask import request, jsonify, url_for
+from sqlalchemy.orm import defer
+from src.models.job import Job
+from src.services.jobs import job_runner, JobQueueFull
+import src.services.catalog_jobs  # noqa: F401  (registers the catalog job handlers)
+
+# Number of jobs returned by the list endpoint
+LIST_LIMIT = 50
+
+
+class JobController:
+    """Controller for background job operations"""
+
+    @staticmethod
+    def get_all():
+        """Get the most recent jobs (without their results)"""
+        jobs = Job.query.options(defer(Job.result)) \
+            .order_by(Job.created_at.desc()).limit(LIST_LIMIT).all()
+        return jsonify([j.to_dict(include_result=False) for j in jobs]), 200
+
+    @staticmethod
+    def create():
+        """Submit a job; returns at once with its ID"""
+        data = request.get_json()
+        
+        if not data or 'type' not in data:
+            return jsonify({'error': 'Type is required'}), 400
+        
+        if not isinstance(data.get('params', {}), dict):
+            return jsonify({'error': 'Params must be an object'}), 400
+        
+        try:
+            job = job_runner.submit(data['type'], data.get('params'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except JobQueueFull as e:
+            response = jsonify({'error': str(e)})
+            response.headers['Retry-After'] = '30'
+            return response, 503
+        
+        response = jsonify(job.to_dict())
+        response.headers['Location'] = url_for('jobs.get_by_id', job_id=job.id)
+        return response, 202
+
+    @staticmethod
+    def get_by_id(job_id):
+        """Get a job's status, progress and result"""
+        job = Job.query.get_or_404(job_id)
+        return jsonify(job.to_dict()), 200
@@ -0,0 +1,13 @@
+"""
+Job Routes
+"""
+from flask import Blueprint
+from .job_controller import JobController
+
+# Create blueprint
+job_bp = Blueprint('jobs', __name__, url_prefix='/api/jobs')
+
+# Routes
+job_bp.route('', methods=['GET'])(JobController.get_all)
+job_bp.route('', methods=['POST'])(JobController.create)
+job_bp.route('/<job_id>', methods=['GET'])(JobController.get_by_id)
@@ -2,19 +2,64 @@
 Medicine Controller - Handles all medicine-related business logic
 """
 from flask import request, jsonify
+from sqlalchemy.orm import joinedload
 from src.models.medicine import Medicine
 from src.config.database import db
+from src.services.prefix_index import medicine_index
+from src.services.fieldsets import requested_fields, project
+from src.services.group_commit import group_committer, GroupCommitTimeout
 from algorithms.verifyID import verify_id
 
+# Typeahead result limits
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 50
+
+# Batch lookup limits (chunk stays under SQLite's bound-parameter limit)
+BATCH_MAX_IDS = 5000
+BATCH_CHUNK_SIZE = 500
+
 
 class MedicineController:
     """Controller for medicine CRUD operations"""
 
+    @staticmethod
+    def _query(fields):
+        """Medicine query limited to the requested fields; joins company only if serialized"""
+        query = Medicine.query
+        if fields is None or 'company' in fields:
+            query = query.options(joinedload(Medicine.company_ref))
+        extra = [Medicine.company_id] if fields is not None and 'company' in fields else []
+        return project(query, Medicine, fields, extra)
+
+    @staticmethod
+    def _write(operation):
+        """Run a write operation and commit it, inline or through the group committer"""
+        if group_committer.enabled:
+            return group_committer.submit(operation)
+        result = operation()
+        db.session.commit()
+        return result
+
+    @staticmethod
+    def _busy(error):
+        """503 response for a write the group committer did not answer in time"""
+        response = jsonify({'error': str(error)})
+        response.headers['Retry-After'] = '1'
+        return response, 503
+
     @staticmethod
     def get_all():
-        """Get all medicines"""
-        medicines = Medicine.query.order_by(Medicine.created_at.desc()).all()
-        return jsonify([m.to_dict() for m in medicines]), 200
+        """Get all medicines, or a batch of them when ?ids= is given"""
+        if 'ids' in request.args:
+            return MedicineController.get_many()
+
+        try:
+            fields = requested_fields(Medicine)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        medicines = MedicineController._query(fields).order_by(Medicine.created_at.desc()).all()
+        return jsonify([m.to_dict(fields) for m in medicines]), 200
 
     @staticmethod
     def create():
@@ -28,7 +73,7 @@ class MedicineController:
         if 'company_id' not in data:
             return jsonify({'error': 'Company ID is required'}), 400
         
-        try:
+        def write():
             # Create medicine
             medicine = Medicine(
                 name=data['name'],
@@ -41,12 +86,59 @@ class MedicineController:
             
             # Save to database
             db.session.add(medicine)
-            db.session.commit()
-            
-            return jsonify(medicine.to_dict()), 201
+            db.session.flush()
+            return medicine.to_dict()
+
+        try:
+            result = MedicineController._write(write)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except GroupCommitTimeout as e:
+            return MedicineController._busy(e)
+
+        medicine_index.add(result['id'], result['name'])
+        return jsonify(result), 201
+
+    @staticmethod
+    def get_many():
+        """Get many medicines by ID in one round trip, keyed by ID"""
+        # verify_id accepts spaced IDs ("1015 1905730"); stored IDs have none
+        ids = []
+        for value in request.args.getlist('ids'):
+            ids.extend(''.join(part.split()) for part in value.split(',') if part.strip())
+        ids = list(dict.fromkeys(ids))  # de-duplicate (jsonify returns keys sorted by ID)
+
+        if not ids:
+            return jsonify({'error': 'At least one ID is required'}), 400
+
+        if len(ids) > BATCH_MAX_IDS:
+            return jsonify({'error': f'At most {BATCH_MAX_IDS} IDs per request'}), 400
+
+        try:
+            fields = requested_fields(Medicine)
         except ValueError as e:
             return jsonify({'error': str(e)}), 400
 
+        valid_ids = [medicine_id for medicine_id in ids if verify_id(medicine_id)]
+        valid_set = set(valid_ids)
+
+        found = {}
+        for start in range(0, len(valid_ids), BATCH_CHUNK_SIZE):
+            chunk = valid_ids[start:start + BATCH_CHUNK_SIZE]
+            medicines = MedicineController._query(fields).filter(Medicine.id.in_(chunk)).all()
+            found.update((m.id, m) for m in medicines)
+
+        results = {}
+        for medicine_id in ids:
+            if medicine_id in found:
+                results[medicine_id] = found[medicine_id].to_dict(fields)
+            elif medicine_id in valid_set:
+                results[medicine_id] = {'error': 'not_found'}
+            else:
+                results[medicine_id] = {'error': 'invalid'}
+
+        return jsonify(results), 200
+
     @staticmethod
     def get_by_id(medicine_id):
         """Get a single medicine by ID"""
@@ -54,14 +146,18 @@ class MedicineController:
         # Validate the ID format and checksum
         if not verify_id(medicine_id):
             return jsonify({'error': 'Invalid or mistyped ID'}), 400
+
+        try:
+            fields = requested_fields(Medicine)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        medicine = Medicine.query.get_or_404(medicine_id)
-        return jsonify(medicine.to_dict()), 200
+        medicine = MedicineController._query(fields).get_or_404(medicine_id)
+        return jsonify(medicine.to_dict(fields)), 200
 
     @staticmethod
     def update(medicine_id):
         """Update a medicine (PUT)"""
-        medicine = Medicine.query.get_or_404(medicine_id)
         data = request.get_json()
 
         # Validate the ID format and checksum
@@ -70,12 +166,22 @@ class MedicineController:
         
         if not data:
             return jsonify({'error': 'No data provided'}), 400
-        
-        # Update only provided fields
-        medicine.update(data)
-        
-        db.session.commit()
-        return jsonify(medicine.to_dict()), 200
+
+        def write():
+            medicine = Medicine.query.get_or_404(medicine_id)
+            
+            # Update only provided fields
+            medicine.update(data)
+            db.session.flush()
+            return medicine.to_dict()
+
+        try:
+            result = MedicineController._write(write)
+        except GroupCommitTimeout as e:
+            return MedicineController._busy(e)
+        if 'name' in data:
+            medicine_index.add(result['id'], result['name'])
+        return jsonify(result), 200
 
     @staticmethod
     def delete(medicine_id):
@@ -89,6 +195,7 @@ class MedicineController:
         
         db.session.delete(medicine)
         db.session.commit()
+        medicine_index.remove(medicine_id)
         
         return '', 204
 
@@ -96,13 +203,33 @@ class MedicineController:
     def search():
         """Search medicines by name or description"""
         query = request.args.get('q', '')
+
+        try:
+            fields = requested_fields(Medicine)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
+        medicines = MedicineController._query(fields)
         if query:
-            medicines = Medicine.query.filter(
+            medicines = medicines.filter(
                 (Medicine.name.contains(query)) | 
                 (Medicine.description.contains(query))
-            ).order_by(Medicine.created_at.desc()).all()
-        else:
-            medicines = Medicine.query.order_by(Medicine.created_at.desc()).all()
+            )
+        medicines = medicines.order_by(Medicine.created_at.desc()).all()
         
-        return jsonify([m.to_dict() for m in medicines]), 200
+        return jsonify([m.to_dict(fields) for m in medicines]), 200
+
+    @staticmethod
+    def suggest():
+        """Typeahead: medicines whose name starts with the given prefix"""
+        prefix = request.args.get('prefix', '')
+        limit = request.args.get('limit', SUGGEST_DEFAULT_LIMIT, type=int)
+        limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
+
+        if not prefix.strip():
+            return jsonify([]), 200
+
+        # Build the index from id/name columns only on first use
+        medicine_index.ensure_built(lambda: db.session.query(Medicine.id, Medicine.name).all())
+
+        return jsonify(medicine_index.search(prefix, limit)), 200
@@ -1,26 +1,31 @@
 """
 Medicine Routes - URL endpoints
 """
-from flask import Blueprint
+from flask import Blueprint, request
 from .medicine_controller import MedicineController
+from src.services.idempotency import idempotent
+from src.services.admission import admission
 
 # Create blueprint
 medicine_bp = Blueprint('medicines', __name__, url_prefix='/api/medicines')
 
 # Routes
 @medicine_bp.route('', methods=['GET'])
+@admission.limit(lambda: 'batch' if 'ids' in request.args else 'scan')
 def get_medicines():
-    """GET /api/medicines - Get all medicines"""
+    """GET /api/medicines[?ids=a,b,c] - Get all medicines or a batch by ID"""
     return MedicineController.get_all()
 
 
 @medicine_bp.route('', methods=['POST'])
+@idempotent
 def create_medicine():
     """POST /api/medicines - Create a new medicine"""
     return MedicineController.create()
 
 
 @medicine_bp.route('/<medicine_id>', methods=['GET'])
+@admission.limit('point')
 def get_medicine(medicine_id):
     """GET /api/medicines/{id} - Get a single medicine"""
     return MedicineController.get_by_id(medicine_id)
@@ -39,6 +44,14 @@ def delete_medicine(medicine_id):
 
 
 @medicine_bp.route('/search', methods=['GET'])
+@admission.limit('scan')
 def search_medicines():
     """GET /api/medicines/search?q=term - Search medicines"""
     return MedicineController.search()
+
+
+@medicine_bp.route('/suggest', methods=['GET'])
+@admission.limit('point')
+def suggest_medicines():
+    """GET /api/medicines/suggest?prefix=term - Typeahead suggestions"""
+    return MedicineController.suggest()
@@ -3,5 +3,7 @@ Models package initialization
 """
 from .medicine import Medicine
 from .company import Company
+from .idempotency_key import IdempotencyKey
+from .job import Job
 
-__all__ = ['Medicine', 'Company']
+__all__ = ['Medicine', 'Company', 'IdempotencyKey', 'Job']
@@ -19,16 +19,19 @@ class Company(db.Model):
     # Relationship with medicines
     medicines = db.relationship('Medicine', backref='company_ref', lazy=True)
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON response"""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'code': self.code,
-            'description': self.description,
-            'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() + 'Z' if self.updated_at else None
-        }
+    # Fields exposed by to_dict, in response order
+    FIELDS = ('id', 'name', 'code', 'description', 'created_at', 'updated_at')
+
+    def to_dict(self, fields=None):
+        """Convert model to dictionary for JSON response (optionally only ``fields``)"""
+        return {name: self._serialize(name) for name in self.FIELDS
+                if fields is None or name in fields}
+
+    def _serialize(self, name):
+        value = getattr(self, name)
+        if isinstance(value, datetime):
+            return value.isoformat() + 'Z'
+        return value
 
     def __repr__(self):
         return f'<Company {self.name} ({self.code})>'
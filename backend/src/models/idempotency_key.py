@@ -0,0 +1,24 @@
+"""
+Idempotency Key Model
+"""
+from datetime import datetime
+from src.config.database import db
+
+
+class IdempotencyKey(db.Model):
+    """Stored outcome of a create request, replayed for retries with the same key"""
+    __tablename__ = 'idempotency_key'
+    
+    key = db.Column(db.String(300), primary_key=True)  # "<METHOD> <path> <client key>"
+    request_hash = db.Column(db.String(64), nullable=False)  # sha256 of the request body
+    status_code = db.Column(db.Integer)  # NULL while the original request is in progress
+    response_body = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+    @property
+    def is_complete(self):
+        return self.status_code is not None
+
+    def __repr__(self):
+        return f'<IdempotencyKey {self.key} ({self.status_code})>'
@@ -0,0 +1,47 @@
+"""
+Job Model
+"""
+import json
+from datetime import datetime
+from src.config.database import db
+
+
+class Job(db.Model):
+    """Background job record (status, progress and result of a long-running operation)"""
+    __tablename__ = 'job'
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    
+    id = db.Column(db.String(32), primary_key=True)  # uuid4 hex
+    type = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default=PENDING, index=True)
+    progress = db.Column(db.Float, nullable=False, default=0.0)  # 0.0 - 1.0
+    params = db.Column(db.Text, default='{}')  # JSON
+    result = db.Column(db.Text)  # JSON
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    def to_dict(self, include_result=True):
+        """Convert model to dictionary for JSON response (``result`` only if include_result)"""
+        data = {
+            'id': self.id,
+            'type': self.type,
+            'status': self.status,
+            'progress': self.progress,
+            'params': json.loads(self.params) if self.params else {},
+            'error': self.error,
+            'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None,
+            'started_at': self.started_at.isoformat() + 'Z' if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() + 'Z' if self.finished_at else None
+        }
+        if include_result:
+            data['result'] = json.loads(self.result) if self.result else None
+        return data
+
+    def __repr__(self):
+        return f'<Job {self.type} {self.id} ({self.status})>'
@@ -20,6 +20,10 @@ class Medicine(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Fields exposed by to_dict, in response order ('company' is the nested company dict)
+    FIELDS = ('id', 'name', 'description', 'price', 'stock', 'prescribed',
+              'company_id', 'company', 'created_at', 'updated_at')
+
     def __init__(self, name, description='', price=0.0, stock=0, prescribed=False, company_id=None):
         """Initialize medicine with unique ID"""
         if company_id is None:
@@ -46,20 +50,18 @@ class Medicine(db.Model):
             if not Medicine.query.filter_by(id=new_id).first():
                 return new_id
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON response"""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'price': self.price,
-            'stock': self.stock,
-            'prescribed': self.prescribed,
-            'company_id': self.company_id,
-            'company': self.company_ref.to_dict() if self.company_ref else None,
-            'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() + 'Z' if self.updated_at else None
-        }
+    def to_dict(self, fields=None):
+        """Convert model to dictionary for JSON response (optionally only ``fields``)"""
+        return {name: self._serialize(name) for name in self.FIELDS
+                if fields is None or name in fields}
+
+    def _serialize(self, name):
+        if name == 'company':
+            return self.company_ref.to_dict() if self.company_ref else None
+        value = getattr(self, name)
+        if isinstance(value, datetime):
+            return value.isoformat() + 'Z'
+        return value
 
     def update(self, data):
         """Update medicine with new data"""
@@ -0,0 +1,17 @@
+"""
+Services package - in-process helpers shared by the controllers
+"""
+from .prefix_index import PrefixIndex, medicine_index
+from .fieldsets import requested_fields, project
+from .group_commit import GroupCommitter, GroupCommitTimeout, group_committer
+from .idempotency import IdempotencyStore, idempotency_store, idempotent
+from .admission import AdmissionControl, admission
+from .jobs import JobRunner, JobQueueFull, job_runner
+from .profiler import RequestProfiler, profiler
+
+__all__ = ['PrefixIndex', 'medicine_index', 'requested_fields', 'project',
+           'GroupCommitter', 'GroupCommitTimeout', 'group_committer',
+           'IdempotencyStore', 'idempotency_store', 'idempotent',
+           'AdmissionControl', 'admission',
+           'JobRunner', 'JobQueueFull', 'job_runner',
+           'RequestProfiler', 'profiler']
@@ -0,0 +1,151 @@
+"""
+Admission Control - Per-route concurrency caps and per-client rate limits
+"""
+import functools
+import math
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from flask import request, jsonify
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens/second, holding at most ``burst``"""
+    __slots__ = ('rate', 'burst', 'tokens', 'updated')
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self):
+        """Consume a token; return 0 on success or the seconds until one is available"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionControl:
+    """
+    Sheds load on expensive routes before it reaches the database.
+
+    Routes are tagged with a priority class (see ``ADMISSION_CLASSES``), or
+    with a callable that picks the class from the request. Each (route,
+    class) pair gets its own concurrency cap, so a flood of scans can only
+    occupy that many workers and point lookups are never queued behind
+    them. Each (route, class, client) also gets a token bucket. Excess
+    requests are rejected immediately: 429 when the client is over its rate,
+    503 when the route is at its concurrency cap, both with Retry-After.
+
+    Clients are told apart by ``request.remote_addr``; behind a reverse proxy
+    set PROXY_FIX_X_FOR so that is the real client address, not the proxy's.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.classes = {}
+        self.max_clients = 10000
+        self._buckets = OrderedDict()  # (route, client) -> TokenBucket
+        self._slots = {}               # route -> BoundedSemaphore
+        self._in_flight = defaultdict(int)
+        self._shed = defaultdict(lambda: {'rate_limited': 0, 'overloaded': 0})
+        self._admitted = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.enabled = app.config.get('ADMISSION_CONTROL', False)
+        self.classes = app.config.get('ADMISSION_CLASSES', {})
+        self.max_clients = app.config.get('ADMISSION_MAX_CLIENTS', 10000)
+
+        for name, limits in self.classes.items():
+            if limits['rate'] <= 0 or limits['burst'] < 1:
+                raise ValueError(f"Admission class {name!r} needs rate > 0 and burst >= 1")
+            if limits.get('concurrency') is not None and limits['concurrency'] < 1:
+                raise ValueError(f"Admission class {name!r} needs concurrency >= 1 (or None)")
+
+    def limit(self, priority):
+        """Route decorator: admit the request under a priority class (name or callable)"""
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return view(*args, **kwargs)
+                name = priority() if callable(priority) else priority
+                if name not in self.classes:
+                    return view(*args, **kwargs)
+                return self._admit(name, self.classes[name], view, *args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _admit(self, name, limits, view, *args, **kwargs):
+        endpoint = f'{request.endpoint}:{name}'
+        client = request.remote_addr or 'unknown'
+
+        with self._lock:
+            wait = self._bucket(endpoint, client, limits).take()
+            if wait:
+                self._shed[endpoint]['rate_limited'] += 1
+        if wait:
+            return self._reject(429, 'Rate limit exceeded', wait)
+
+        slots = self._semaphore(endpoint, limits)
+        if slots is not None and not slots.acquire(blocking=False):
+            with self._lock:
+                self._shed[endpoint]['overloaded'] += 1
+            return self._reject(503, 'Server busy, try again shortly', 1)
+
+        with self._lock:
+            self._admitted[endpoint] += 1
+            self._in_flight[endpoint] += 1
+        try:
+            return view(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight[endpoint] -= 1
+            if slots is not None:
+                slots.release()
+
+    def _bucket(self, endpoint, client, limits):
+        """Look up (or create) the client's bucket; caller holds the lock"""
+        key = (endpoint, client)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(limits['rate'], limits['burst'])
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def _semaphore(self, endpoint, limits):
+        if not limits.get('concurrency'):
+            return None
+        with self._lock:
+            if endpoint not in self._slots:
+                self._slots[endpoint] = threading.BoundedSemaphore(limits['concurrency'])
+            return self._slots[endpoint]
+
+    @staticmethod
+    def _reject(status, message, retry_after):
+        response = jsonify({'error': message})
+        response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+        return response, status
+
+    def stats(self):
+        """Snapshot of admitted, shed and in-flight counters per route"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'admitted': dict(self._admitted),
+                'shed': {endpoint: dict(counts) for endpoint, counts in self._shed.items()},
+                'in_flight': {endpoint: n for endpoint, n in self._in_flight.items() if n},
+            }
+
+
+# Shared admission control for the API
+admission = AdmissionControl()
@@ -0,0 +1,106 @@
+"""
+Catalog Jobs - Long-running catalog operations run through the job runner
+"""
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
+from src.config.database import db
+from src.models.medicine import Medicine
+from src.services.jobs import job_runner
+from src.services.prefix_index import medicine_index
+
+# Rows handled between commits / progress updates
+CHUNK_SIZE = 200
+
+
+def _row_error(data):
+    """Return why an import row is unusable, or None if it looks valid"""
+    if not isinstance(data, dict):
+        return 'Row must be an object'
+    name = data.get('name')
+    if not isinstance(name, str) or not name.strip():
+        return 'Name is required and must be a non-empty string'
+    company_id = data.get('company_id')
+    if not isinstance(company_id, int) or isinstance(company_id, bool):
+        return 'Company ID is required and must be an integer'
+    return None
+
+
+def _begin_chunk():
+    """Open the chunk transaction explicitly so per-row SAVEPOINTs nest inside it"""
+    # pysqlite sends no BEGIN of its own before a SAVEPOINT
+    if db.engine.dialect.name == 'sqlite':
+        db.session.execute(text('BEGIN IMMEDIATE'))
+
+
+@job_runner.task('import')
+def import_medicines(params, progress):
+    """
+    Create medicines from params['medicines'] (same fields as POST /api/medicines).
+
+    Each row runs in its own SAVEPOINT, so a row that fails validation or a
+    database constraint becomes an ``errors`` entry without discarding the
+    other rows of its chunk.
+    """
+    items = params.get('medicines')
+    if not isinstance(items, list) or not items:
+        raise ValueError("params.medicines must be a non-empty list")
+
+    created, errors = 0, []
+    for start in range(0, len(items), CHUNK_SIZE):
+        added = []
+        _begin_chunk()
+        for index, data in enumerate(items[start:start + CHUNK_SIZE], start=start):
+            error = _row_error(data)
+            if error:
+                errors.append({'index': index, 'error': error})
+                continue
+            try:
+                with db.session.begin_nested():
+                    medicine = Medicine(
+                        name=data['name'],
+                        description=data.get('description', ''),
+                        price=data.get('price', 0.0),
+                        stock=data.get('stock', 0),
+                        prescribed=data.get('prescribed', False),
+                        company_id=data['company_id']
+                    )
+                    db.session.add(medicine)
+                    db.session.flush()
+            except (ValueError, SQLAlchemyError) as e:
+                errors.append({'index': index, 'error': str(e.orig) if hasattr(e, 'orig') else str(e)})
+                continue
+            added.append((medicine.id, medicine.name))
+
+        db.session.commit()
+        for medicine_id, name in added:
+            medicine_index.add(medicine_id, name)
+        created += len(added)
+        progress(min(start + CHUNK_SIZE, len(items)) / len(items))
+
+    return {'created': created, 'errors': errors}
+
+
+@job_runner.task('export')
+def export_medicines(params, progress):
+    """Serialize the full medicine catalog"""
+    total = Medicine.query.count()
+    query = Medicine.query.options(joinedload(Medicine.company_ref)).order_by(Medicine.id)
+
+    # Keyset pagination: each chunk starts after the last ID already exported
+    medicines, last_id = [], ''
+    while True:
+        chunk = query.filter(Medicine.id > last_id).limit(CHUNK_SIZE).all()
+        if not chunk:
+            break
+        medicines.extend(m.to_dict() for m in chunk)
+        last_id = chunk[-1].id
+        progress(len(medicines) / max(total, len(medicines)))
+    return {'count': len(medicines), 'medicines': medicines}
+
+
+@job_runner.task('reindex')
+def reindex_medicines(params, progress):
+    """Rebuild the in-memory typeahead index from the database"""
+    indexed = medicine_index.build(lambda: db.session.query(Medicine.id, Medicine.name).all())
+    return {'indexed': indexed}
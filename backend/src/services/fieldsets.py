@@ -0,0 +1,38 @@
+"""
+Sparse Fieldsets - ?fields= parsing and SQL column projection
+"""
+from flask import request
+from sqlalchemy.orm import load_only
+
+
+def requested_fields(model):
+    """
+    Parse ``?fields=a,b,c`` against ``model.FIELDS``.
+
+    Returns a set of field names, or None when every field is wanted.
+    Raises ValueError for fields the model does not expose.
+    """
+    raw = request.args.get('fields')
+    if raw is None:
+        return None
+
+    fields = {part.strip() for part in raw.split(',') if part.strip()}
+    if not fields:
+        return None
+
+    unknown = sorted(fields - set(model.FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    return fields
+
+
+def project(query, model, fields, extra_columns=()):
+    """Restrict the query's SELECT to the columns behind the requested fields"""
+    if fields is None:
+        return query
+    columns = [getattr(model, name) for name in model.FIELDS
+               if name in fields and name in model.__table__.columns]
+    columns.extend(extra_columns)
+    if not columns:
+        columns = [model.__mapper__.primary_key[0]]
+    return query.options(load_only(*columns))
@@ -0,0 +1,148 @@
+"""
+Group Commit - Coalesces single-item writes into shared transactions
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from sqlalchemy import text
+from src.config.database import db
+
+logger = logging.getLogger(__name__)
+
+
+class GroupCommitTimeout(Exception):
+    """Raised when a queued write has not been answered within the timeout"""
+
+
+class GroupCommitter:
+    """
+    Writer thread that merges concurrent write operations into one commit.
+
+    Each operation is a callable that mutates ``db.session`` and returns its
+    response payload. The writer collects operations for up to ``window``
+    seconds or ``max_batch`` items, runs each inside its own SAVEPOINT so a
+    failing item only rolls back itself, then commits the batch once and
+    hands every caller its own result or exception.
+
+    The writer survives any error in a batch: unanswered callers in that
+    batch get the error and the loop carries on. Callers wait at most
+    ``timeout`` seconds; a write still queued by then is cancelled and
+    never runs, one already running may still commit.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.window = 0.005
+        self.max_batch = 64
+        self.timeout = 30
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def init_app(self, app):
+        """Start the writer thread if GROUP_COMMIT is enabled for the app"""
+        self.enabled = app.config.get('GROUP_COMMIT', False)
+        if not self.enabled:
+            return
+        self.window = app.config.get('GROUP_COMMIT_WINDOW_MS', 5) / 1000
+        self.max_batch = app.config.get('GROUP_COMMIT_MAX_BATCH', 64)
+        self.timeout = app.config.get('GROUP_COMMIT_TIMEOUT_SECONDS', 30)
+
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, args=(app,), name='group-commit', daemon=True
+            )
+            self._thread.start()
+
+    def submit(self, operation):
+        """Queue an operation and block until its batch has committed"""
+        future = Future()
+        self._queue.put((operation, future))
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()  # skipped by the writer if it has not started yet
+            raise GroupCommitTimeout('Write was not committed in time') from None
+
+    def _run(self, app):
+        with app.app_context():
+            while True:
+                batch = self._collect()
+                try:
+                    self._commit(batch)
+                except BaseException as e:
+                    logger.exception('Group commit batch failed')
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    try:
+                        db.session.remove()
+                    except Exception:
+                        logger.exception('Could not reset the group commit session')
+
+    def _collect(self):
+        """Wait for one operation, then gather more until the window closes"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _commit(self, batch):
+        try:
+            self._begin()
+        except Exception as e:
+            db.session.rollback()
+            db.session.remove()
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        outcomes = []
+        for operation, future in batch:
+            # Skip writes whose caller already gave up (timed out and cancelled)
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                with db.session.begin_nested():
+                    outcomes.append((future, operation(), None))
+            except Exception as e:
+                outcomes.append((future, None, e))
+
+        try:
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            outcomes = [(future, None, error or e) for future, _, error in outcomes]
+        finally:
+            db.session.remove()
+
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _begin(self):
+        """Open the batch transaction explicitly, before the first SAVEPOINT"""
+        # pysqlite never sends BEGIN on its own before a SAVEPOINT, so each
+        # savepoint would become the outermost transaction and RELEASE would
+        # commit every item separately. BEGIN IMMEDIATE also takes the write
+        # lock up front: a deferred transaction that reads before writing has
+        # to upgrade its lock, which SQLite refuses when another writer waits.
+        if db.engine.dialect.name == 'sqlite':
+            db.session.execute(text('BEGIN IMMEDIATE'))
+        else:
+            db.session.begin()
+
+
+# Shared committer for single-item medicine writes
+group_committer = GroupCommitter()
@@ -0,0 +1,186 @@
+"""
+Idempotency - Replays stored responses for retried requests with an Idempotency-Key
+"""
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from flask import request, jsonify, make_response, current_app
+from sqlalchemy.exc import IntegrityError
+from src.config.database import db
+from src.models.idempotency_key import IdempotencyKey
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+
+class ResponseCache:
+    """Bounded LRU of completed responses: key -> (expires_at, request_hash, status, body)"""
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= datetime.utcnow():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class IdempotencyStore:
+    """
+    Claims, completes and replays idempotency keys.
+
+    The primary key on ``idempotency_key`` is the arbiter between concurrent
+    duplicates: whichever request inserts the row first runs the handler,
+    the others see an in-progress row and get 409 until it completes.
+    """
+
+    def __init__(self):
+        self.cache = ResponseCache()
+        self._last_purge = 0.0
+
+    def init_app(self, app):
+        self.cache.max_size = app.config.get('IDEMPOTENCY_CACHE_SIZE', 1024)
+
+    def handle(self, view, client_key, *args, **kwargs):
+        """Run ``view`` at most once per key and replay its response afterwards"""
+        if len(client_key) > MAX_KEY_LENGTH:
+            return jsonify({'error': f'{HEADER} must be at most {MAX_KEY_LENGTH} characters'}), 400
+
+        key = f'{request.method} {request.path} {client_key}'
+        request_hash = hashlib.sha256(request.get_data()).hexdigest()
+        expires_at = datetime.utcnow() + timedelta(
+            seconds=current_app.config.get('IDEMPOTENCY_TTL_SECONDS', 86400))
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._replay(cached, request_hash)
+
+        self._purge_expired()
+        claimed, row = self._claim(key, request_hash, expires_at)
+        if not claimed:
+            if row is None or not row.is_complete:
+                response = jsonify({'error': 'A request with this Idempotency-Key is in progress'})
+                response.headers['Retry-After'] = '1'
+                return response, 409
+            entry = (row.expires_at, row.request_hash, row.status_code, row.response_body)
+            self.cache.put(key, entry)
+            return self._replay(entry, request_hash)
+
+        try:
+            response = make_response(view(*args, **kwargs))
+        except Exception:
+            self._release(key)
+            raise
+
+        # Server errors are not stored so the client can retry them
+        if response.status_code >= 500:
+            self._release(key)
+            return response
+
+        self._complete(key, response, request_hash, expires_at)
+        return response
+
+    def _claim(self, key, request_hash, expires_at):
+        """
+        Insert an in-progress row for the key.
+
+        Returns ``(True, None)`` when this request now holds the key, or
+        ``(False, row)`` when it does not: ``row`` is the holder's record, or
+        None if the key kept changing hands (treated as in progress).
+        """
+        now = datetime.utcnow()
+        for _ in range(2):
+            db.session.add(IdempotencyKey(key=key, request_hash=request_hash, expires_at=expires_at))
+            try:
+                db.session.commit()
+                return True, None
+            except IntegrityError:
+                db.session.rollback()
+
+            # Read the holder in its own transaction so the delete below starts a
+            # fresh write instead of upgrading a read lock (SQLite deadlocks on that)
+            existing = db.session.get(IdempotencyKey, key)
+            if existing is None:
+                continue
+            db.session.expunge(existing)
+            db.session.rollback()
+
+            stale_pending = (not existing.is_complete and existing.created_at < now - timedelta(
+                seconds=current_app.config.get('IDEMPOTENCY_PENDING_TIMEOUT_SECONDS', 60)))
+            if existing.expires_at > now and not stale_pending:
+                return False, existing
+
+            # Expired, or abandoned by a crashed worker: drop it and claim again.
+            # Matching on created_at keeps a slow taker from deleting a fresh claim.
+            IdempotencyKey.query.filter_by(key=key, created_at=existing.created_at) \
+                .delete(synchronize_session=False)
+            db.session.commit()
+
+        # Lost the race on every pass: never run the view without holding the key
+        return False, None
+
+    def _complete(self, key, response, request_hash, expires_at):
+        body = response.get_data(as_text=True)
+        updated = IdempotencyKey.query.filter_by(key=key, status_code=None).update(
+            {'status_code': response.status_code, 'response_body': body},
+            synchronize_session=False,
+        )
+        db.session.commit()
+        if updated:  # zero if the claim was taken over as stale while the handler ran
+            self.cache.put(key, (expires_at, request_hash, response.status_code, body))
+
+    def _release(self, key):
+        db.session.rollback()
+        IdempotencyKey.query.filter_by(key=key, status_code=None).delete(synchronize_session=False)
+        db.session.commit()
+
+    def _replay(self, entry, request_hash):
+        _, stored_hash, status_code, body = entry
+        if stored_hash != request_hash:
+            return jsonify({'error': f'{HEADER} was already used with a different request body'}), 422
+        response = current_app.response_class(body, status=status_code, mimetype='application/json')
+        response.headers['Idempotent-Replayed'] = 'true'
+        return response
+
+    def _purge_expired(self):
+        """Delete expired keys, at most once a minute per process"""
+        now = time.monotonic()
+        if now - self._last_purge < 60:
+            return
+        self._last_purge = now
+        IdempotencyKey.query.filter(IdempotencyKey.expires_at <= datetime.utcnow()) \
+            .delete(synchronize_session=False)
+        db.session.commit()
+
+
+# Shared store for idempotent create endpoints
+idempotency_store = IdempotencyStore()
+
+
+def idempotent(view):
+    """Route decorator: honour the Idempotency-Key header when present"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        client_key = request.headers.get(HEADER)
+        if not client_key:
+            return view(*args, **kwargs)
+        return idempotency_store.handle(view, client_key, *args, **kwargs)
+    return wrapper
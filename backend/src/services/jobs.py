@@ -0,0 +1,135 @@
+"""
+Job Runner - Background execution of long-running catalog operations
+"""
+import json
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from flask import current_app
+from src.config.database import db
+from src.models.job import Job
+
+
+class JobQueueFull(Exception):
+    """Raised when too many jobs are already pending or running"""
+
+
+class JobRunner:
+    """
+    Runs registered job handlers on a bounded thread pool.
+
+    Jobs are persisted in the ``job`` table, so callers get an ID back at
+    once and poll it for progress and results. A handler is called as
+    ``handler(params, progress)``; ``progress(fraction)`` records progress
+    and commits the session. Whatever the handler returns (JSON-serializable)
+    becomes the job result; an exception marks the job failed.
+
+    On the first request after a restart, jobs still ``pending`` are queued
+    again and jobs left ``running`` by the dead process are marked failed.
+    This assumes a single server process, as with ``python app.py``.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.max_pending = 100
+        self._executor = None
+        self._app = None
+        self._recovered = False
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self._app = app
+        self.max_pending = app.config.get('JOBS_MAX_PENDING', 100)
+        self._executor = ThreadPoolExecutor(
+            max_workers=app.config.get('JOBS_MAX_WORKERS', 2), thread_name_prefix='job'
+        )
+        # Recover on first request rather than at import, so the debug
+        # reloader's watcher process never picks up jobs
+        app.before_request(self._recover_once)
+
+    def task(self, job_type):
+        """Decorator: register a handler for a job type"""
+        def decorator(handler):
+            self.handlers[job_type] = handler
+            return handler
+        return decorator
+
+    def submit(self, job_type, params=None):
+        """Persist a new job and queue it; returns the Job"""
+        if job_type not in self.handlers:
+            raise ValueError(f"Unknown job type: {job_type!r}")
+
+        active = Job.query.filter(Job.status.in_([Job.PENDING, Job.RUNNING])).count()
+        if active >= self.max_pending:
+            raise JobQueueFull('Too many jobs queued, try again later')
+
+        job = Job(id=uuid.uuid4().hex, type=job_type, params=json.dumps(params or {}))
+        db.session.add(job)
+        db.session.commit()
+
+        self._executor.submit(self._execute, job.id)
+        return job
+
+    def _recover_once(self):
+        if self._recovered:
+            return
+        with self._lock:
+            if self._recovered:
+                return
+            self._recovered = True
+
+        Job.query.filter_by(status=Job.RUNNING).update({
+            'status': Job.FAILED,
+            'error': 'Interrupted by server restart',
+            'finished_at': datetime.utcnow(),
+        }, synchronize_session=False)
+        db.session.commit()
+
+        for (job_id,) in db.session.query(Job.id).filter_by(status=Job.PENDING) \
+                .order_by(Job.created_at).all():
+            self._executor.submit(self._execute, job_id)
+
+    def _execute(self, job_id):
+        with self._app.app_context():
+            try:
+                self._run(job_id)
+            finally:
+                db.session.remove()
+
+    def _run(self, job_id):
+        # Claim atomically so a job queued twice still runs once
+        claimed = Job.query.filter_by(id=job_id, status=Job.PENDING).update(
+            {'status': Job.RUNNING, 'started_at': datetime.utcnow()},
+            synchronize_session=False,
+        )
+        db.session.commit()
+        if not claimed:
+            return
+
+        job = db.session.get(Job, job_id)
+        handler = self.handlers.get(job.type)
+
+        def progress(fraction):
+            job.progress = max(0.0, min(1.0, float(fraction)))
+            db.session.commit()
+
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job type {job.type!r}")
+            result = json.dumps(handler(json.loads(job.params or '{}'), progress))
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.exception('Job %s (%s) failed', job_id, job.type)
+            job.status = Job.FAILED
+            job.error = str(e) or e.__class__.__name__
+        else:
+            job.status = Job.SUCCEEDED
+            job.progress = 1.0
+            job.result = result
+        job.finished_at = datetime.utcnow()
+        db.session.commit()
+
+
+# Shared job runner
+job_runner = JobRunner()
@@ -0,0 +1,104 @@
+"""
+Prefix Index - In-memory typeahead lookup over medicine names
+"""
+import bisect
+import threading
+
+
+def normalize(text):
+    """Normalize a name for prefix matching (case-folded, single-spaced)"""
+    return ' '.join((text or '').split()).casefold()
+
+
+class PrefixIndex:
+    """
+    Sorted-array prefix index over (normalized name, id) pairs.
+
+    Lookups bisect to the first key >= prefix and walk forward while the
+    prefix still matches, so a top-k query costs O(log n + k). The index
+    lives in process memory: it is built lazily from the database on first
+    use and kept current by the controllers on create, rename and delete.
+
+    Builds hold ``_build_lock`` from reading the rows until the swap, and
+    ``add``/``remove`` wait on it, so a change committed while a build is
+    reading is applied after the swap instead of being overwritten.
+    """
+
+    def __init__(self):
+        self._keys = []        # sorted list of (normalized_name, id)
+        self._names = {}       # id -> (normalized_name, display name)
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._built = False
+
+    @property
+    def is_built(self):
+        return self._built
+
+    def ensure_built(self, load_rows):
+        """Build from ``load_rows()`` (id, name) rows unless already built"""
+        if self._built:
+            return
+        with self._build_lock:
+            if not self._built:  # another request may have built it meanwhile
+                self._swap(load_rows())
+
+    def build(self, load_rows):
+        """Replace the index contents with the (id, name) rows from ``load_rows()``"""
+        with self._build_lock:
+            return self._swap(load_rows())
+
+    def _swap(self, rows):
+        names = {item_id: (normalize(name), name) for item_id, name in rows}
+        keys = sorted((key, item_id) for item_id, (key, _) in names.items())
+        with self._lock:
+            self._names = names
+            self._keys = keys
+            self._built = True
+        return len(names)
+
+    def add(self, item_id, name):
+        """Insert or rename an entry"""
+        with self._build_lock, self._lock:
+            self._remove_locked(item_id)
+            key = normalize(name)
+            bisect.insort(self._keys, (key, item_id))
+            self._names[item_id] = (key, name)
+
+    def remove(self, item_id):
+        """Drop an entry if present"""
+        with self._build_lock, self._lock:
+            self._remove_locked(item_id)
+
+    def _remove_locked(self, item_id):
+        entry = self._names.pop(item_id, None)
+        if entry is None:
+            return
+        pos = bisect.bisect_left(self._keys, (entry[0], item_id))
+        if pos < len(self._keys) and self._keys[pos] == (entry[0], item_id):
+            del self._keys[pos]
+
+    def search(self, prefix, limit=10):
+        """Return up to ``limit`` {'id', 'name'} dicts whose name starts with prefix"""
+        key = normalize(prefix)
+        results = []
+        with self._lock:
+            pos = bisect.bisect_left(self._keys, (key, ''))
+            while pos < len(self._keys) and len(results) < limit:
+                name_key, item_id = self._keys[pos]
+                if not name_key.startswith(key):
+                    break
+                results.append({'id': item_id, 'name': self._names[item_id][1]})
+                pos += 1
+        return results
+
+    def clear(self):
+        """Forget all entries; the next lookup rebuilds from the database"""
+        with self._build_lock, self._lock:
+            self._keys = []
+            self._names = {}
+            self._built = False
+
+
+# Shared index of medicine names
+medicine_index = PrefixIndex()
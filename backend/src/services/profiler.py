@@ -0,0 +1,119 @@
+"""
+Request Profiler - Opt-in cProfile capture of individual requests
+"""
+import cProfile
+import hmac
+import os
+import random
+import re
+import threading
+from datetime import datetime
+from flask import request, g
+
+TOKEN_HEADER = 'X-Profile-Token'
+
+
+class RequestProfiler:
+    """
+    Runs selected requests under cProfile and saves a pstats file per request.
+
+    Nothing is registered on the app unless PROFILING is enabled, so the
+    disabled path costs nothing. A request is profiled when it carries
+    ``X-Profile-Token`` matching PROFILING_TOKEN, or when it is picked by
+    PROFILING_SAMPLE_RATE. Only one request is profiled at a time, and the
+    oldest files are deleted beyond PROFILING_MAX_FILES. Open a saved file
+    with ``python -m pstats <file>`` or a viewer such as snakeviz.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.token = ''
+        self.sample_rate = 0.0
+        self.max_files = 50
+        self.directory = None
+        self._busy = threading.Lock()
+
+    def init_app(self, app):
+        self.enabled = app.config.get('PROFILING', False)
+        if not self.enabled:
+            return
+        self.token = app.config.get('PROFILING_TOKEN', '')
+        self.sample_rate = app.config.get('PROFILING_SAMPLE_RATE', 0.0)
+        self.max_files = app.config.get('PROFILING_MAX_FILES', 50)
+        self.directory = app.config.get('PROFILING_DIR') or os.path.join(app.instance_path, 'profiles')
+        os.makedirs(self.directory, exist_ok=True)
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._abort)
+
+    def is_authorized(self):
+        """True if the request carries the configured profiling token"""
+        supplied = request.headers.get(TOKEN_HEADER, '')
+        return bool(self.token) and hmac.compare_digest(supplied, self.token)
+
+    def _wanted(self):
+        if request.blueprint == 'admin':
+            return False  # listing/downloading profiles should not evict them
+        if self.is_authorized():
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def _start(self):
+        if not self._wanted() or not self._busy.acquire(blocking=False):
+            return
+        g.profiler = cProfile.Profile()
+        g.profiler.enable()
+
+    def _finish(self, response):
+        profiler = g.pop('profiler', None)
+        if profiler is None:
+            return response
+        profiler.disable()
+        self._busy.release()
+
+        name = self._filename()
+        profiler.dump_stats(os.path.join(self.directory, name))
+        self._prune()
+        response.headers['X-Profile-File'] = name
+        return response
+
+    def _abort(self, error=None):
+        # Request failed before after_request ran: stop without saving
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+            self._busy.release()
+
+    def _filename(self):
+        stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%S%fZ')
+        route = re.sub(r'[^A-Za-z0-9_.-]', '_', request.endpoint or 'unknown')
+        return f'{stamp}_{request.method}_{route}.prof'
+
+    def _prune(self):
+        """Delete the oldest profiles beyond max_files"""
+        for name in self.list_profiles()[self.max_files:]:
+            try:
+                os.remove(os.path.join(self.directory, name['name']))
+            except FileNotFoundError:
+                pass
+
+    def list_profiles(self):
+        """Saved profiles, newest first"""
+        if not self.directory or not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith('.prof'):
+                stat = entry.stat()
+                profiles.append({
+                    'name': entry.name,
+                    'size': stat.st_size,
+                    'created_at': datetime.utcfromtimestamp(stat.st_mtime).isoformat() + 'Z',
+                })
+        profiles.sort(key=lambda p: p['name'], reverse=True)
+        return profiles
+
+
+# Shared request profiler
+profiler = RequestProfiler()
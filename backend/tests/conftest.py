@@ -0,0 +1,95 @@
+"""
+Shared pytest fixtures
+
+The app module builds its app from environment settings at import time,
+so the environment is prepared here before anything from the app is
+imported: a throwaway SQLite file, group commit on, debug off (so view
+errors become 500 responses instead of propagating).
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+_DB_DIR = tempfile.mkdtemp(prefix='pharmacy-tests-')
+os.environ['DATABASE_URI'] = f"sqlite:///{os.path.join(_DB_DIR, 'test.db')}"
+os.environ['GROUP_COMMIT'] = 'true'
+os.environ['FLASK_ENV'] = 'testing'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app as flask_app  # noqa: E402
+from src.config.database import db  # noqa: E402
+from src.models.company import Company  # noqa: E402
+from src.models.idempotency_key import IdempotencyKey  # noqa: E402
+from src.models.medicine import Medicine  # noqa: E402
+from src.services.group_commit import group_committer  # noqa: E402
+from src.services.idempotency import idempotency_store  # noqa: E402
+from src.services.prefix_index import medicine_index  # noqa: E402
+
+SEEDED_COMPANIES = 4
+
+
+@pytest.fixture(scope='session')
+def app():
+    # Let the one-off job recovery run now, while no test holds the writer
+    flask_app.test_client().get('/api/companies')
+    yield flask_app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def clean_database(app):
+    """Reset tables and in-memory state touched by the tests"""
+    yield
+    with app.app_context():
+        Medicine.query.delete()
+        IdempotencyKey.query.delete()
+        Company.query.filter(Company.id > SEEDED_COMPANIES).delete()
+        db.session.commit()
+    idempotency_store.cache._entries.clear()
+    medicine_index.clear()
+    group_committer.timeout = flask_app.config['GROUP_COMMIT_TIMEOUT_SECONDS']
+
+
+@pytest.fixture
+def writer_gate():
+    """
+    Hold the group-commit writer inside a batch until released.
+
+    While held, every write submitted afterwards waits in the queue, and
+    once released they are all collected into the next batch.
+    """
+    release = threading.Event()
+    entered = threading.Event()
+
+    def gate():
+        entered.set()
+        release.wait(10)
+
+    thread = threading.Thread(target=group_committer.submit, args=(gate,))
+    thread.start()
+    assert entered.wait(5)
+
+    def wait_for_queued(count):
+        deadline = time.monotonic() + 5
+        while group_committer._queue.qsize() < count:
+            assert time.monotonic() < deadline, 'writes were not queued in time'
+            time.sleep(0.005)
+
+    release.wait_for_queued = wait_for_queued
+    yield release
+    release.set()
+    thread.join(5)
+
+
+def medicine_count(app):
+    with app.app_context():
+        return Medicine.query.count()
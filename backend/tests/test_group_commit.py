@@ -0,0 +1,112 @@
+"""
+Group commit: batching, per-item isolation and writer resilience
+"""
+import threading
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+from algorithms.generateID import generate_id
+from src.config.database import db
+from src.models.company import Company
+from src.services.group_commit import group_committer
+from tests.conftest import medicine_count
+
+
+def _run_in_thread(target, results, key):
+    def run():
+        try:
+            results[key] = target()
+        except BaseException as e:
+            results[key] = e
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_mixed_batch_commits_once_and_isolates_failures(app, writer_gate):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if threading.current_thread().name == 'group-commit':
+            statements.append(statement.split()[0])
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+
+    def duplicate_company():
+        db.session.add(Company(name='Duplicate Code', code='101'))
+        db.session.flush()
+
+    missing_id = generate_id(prescribed=True, company_code='101')
+    requests = {
+        'ok_1': lambda: app.test_client().post('/api/medicines', json={'name': 'One', 'company_id': 1}),
+        'ok_2': lambda: app.test_client().post('/api/medicines', json={'name': 'Two', 'company_id': 2}),
+        'bad_company': lambda: app.test_client().post('/api/medicines', json={'name': 'X', 'company_id': 99}),
+        'missing': lambda: app.test_client().put(f'/api/medicines/{missing_id}', json={'name': 'Y'}),
+        'constraint': lambda: group_committer.submit(duplicate_company),
+    }
+    results, threads = {}, []
+    try:
+        for count, (key, target) in enumerate(requests.items(), start=1):
+            threads.append(_run_in_thread(target, results, key))
+            writer_gate.wait_for_queued(count)
+        statements.clear()
+        writer_gate.set()
+        for thread in threads:
+            thread.join(10)
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+    assert results['ok_1'].status_code == 201
+    assert results['ok_2'].status_code == 201
+    assert results['bad_company'].status_code == 400
+    assert results['missing'].status_code == 404
+    assert isinstance(results['constraint'], IntegrityError)
+    assert medicine_count(app) == 2
+
+    # One transaction for the whole batch, one savepoint per item
+    assert statements.count('BEGIN') == 1
+    assert statements.count('SAVEPOINT') == len(requests)
+
+
+def test_writer_survives_an_operation_raising_base_exception(client):
+    class Abort(BaseException):
+        pass
+
+    def explode():
+        raise Abort()
+
+    with pytest.raises(Abort):
+        group_committer.submit(explode)
+
+    response = client.post('/api/medicines', json={'name': 'After', 'company_id': 1})
+    assert response.status_code == 201
+
+
+def test_writer_survives_a_failing_batch(client, monkeypatch):
+    def broken_commit(batch):
+        raise RuntimeError('lost connection')
+
+    monkeypatch.setattr(group_committer, '_commit', broken_commit)
+    with pytest.raises(RuntimeError):
+        group_committer.submit(lambda: None)
+    monkeypatch.undo()
+
+    response = client.post('/api/medicines', json={'name': 'After', 'company_id': 1})
+    assert response.status_code == 201
+
+
+def test_timed_out_write_returns_503_and_never_commits(app, client, writer_gate):
+    group_committer.timeout = 0.1
+
+    response = client.post('/api/medicines', json={'name': 'Late', 'company_id': 1})
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+
+    writer_gate.set()
+    group_committer.timeout = 30
+    group_committer.submit(lambda: None)  # wait for the writer to drain the queue
+    assert medicine_count(app) == 0
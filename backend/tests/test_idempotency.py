@@ -0,0 +1,158 @@
+"""
+Idempotency keys: one execution per key under concurrency, replay and release
+"""
+import threading
+from datetime import datetime, timedelta
+
+from src.config.database import db
+from src.controllers.medicine.medicine_controller import MedicineController
+from src.models.idempotency_key import IdempotencyKey
+from src.services.group_commit import group_committer
+from src.services.idempotency import idempotency_store
+from tests.conftest import medicine_count
+
+BODY = {'name': 'Aspirin', 'company_id': 1}
+
+
+def _post(app, body=BODY, key='key-1'):
+    return app.test_client().post('/api/medicines', json=body, headers={'Idempotency-Key': key})
+
+
+def _insert_claim(app, key='key-1', created_at=None, status_code=None):
+    now = datetime.utcnow()
+    with app.app_context():
+        db.session.add(IdempotencyKey(
+            key=f'POST /api/medicines {key}',
+            request_hash='0' * 64,
+            status_code=status_code,
+            response_body='{}' if status_code else None,
+            created_at=created_at or now,
+            expires_at=now + timedelta(days=1),
+        ))
+        db.session.commit()
+
+
+def test_concurrent_duplicates_run_once(app):
+    barrier = threading.Barrier(10)
+    statuses = []
+
+    def send():
+        barrier.wait()
+        response = _post(app)
+        statuses.append((response.status_code, response.headers.get('Idempotent-Replayed')))
+
+    threads = [threading.Thread(target=send) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    assert medicine_count(app) == 1
+    assert statuses.count((201, None)) == 1
+    assert all(status in (201, 409) for status, _ in statuses)
+
+
+def test_duplicate_while_in_progress_gets_409_then_replay(app, monkeypatch):
+    # Hold the original request after it claimed the key, before its write
+    release = threading.Event()
+    submitted = threading.Event()
+    submit = group_committer.submit
+
+    def held_submit(operation):
+        submitted.set()
+        release.wait(10)
+        return submit(operation)
+
+    monkeypatch.setattr(group_committer, 'submit', held_submit)
+    results = {}
+    original = threading.Thread(target=lambda: results.setdefault('original', _post(app)))
+    original.start()
+    assert submitted.wait(5)
+
+    for _ in range(3):
+        response = _post(app)
+        assert response.status_code == 409
+        assert response.headers['Retry-After'] == '1'
+
+    release.set()
+    original.join(10)
+    assert results['original'].status_code == 201
+
+    replay = _post(app)
+    assert replay.status_code == 201
+    assert replay.headers['Idempotent-Replayed'] == 'true'
+    assert replay.get_json() == results['original'].get_json()
+    assert medicine_count(app) == 1
+
+
+def test_same_key_with_different_body_gets_422(app):
+    assert _post(app).status_code == 201
+
+    response = _post(app, body={'name': 'Ibuprofen', 'company_id': 1})
+    assert response.status_code == 422
+    assert medicine_count(app) == 1
+
+
+def test_stored_response_is_checked_against_the_body(app):
+    # Another worker completed the key: only the database row knows about it
+    first = _post(app)
+    idempotency_store.cache._entries.clear()
+
+    assert _post(app, body={'name': 'Ibuprofen', 'company_id': 1}).status_code == 422
+    replay = _post(app)
+    assert replay.status_code == 201
+    assert replay.headers['Idempotent-Replayed'] == 'true'
+    assert replay.get_json() == first.get_json()
+
+
+def test_server_error_releases_the_key(app, monkeypatch):
+    def broken_create():
+        raise RuntimeError('downstream failure')
+
+    monkeypatch.setattr(MedicineController, 'create', staticmethod(broken_create))
+    assert _post(app).status_code == 500
+    monkeypatch.undo()
+
+    response = _post(app)
+    assert response.status_code == 201
+    assert 'Idempotent-Replayed' not in response.headers
+    assert medicine_count(app) == 1
+
+
+def test_server_error_response_releases_the_key(app, monkeypatch):
+    def unavailable():
+        return {'error': 'Service unavailable'}, 503
+
+    monkeypatch.setattr(MedicineController, 'create', staticmethod(unavailable))
+    assert _post(app).status_code == 503
+    monkeypatch.undo()
+
+    assert _post(app).status_code == 201
+    assert medicine_count(app) == 1
+
+
+def test_fresh_pending_claim_is_not_taken_over(app):
+    _insert_claim(app)
+
+    assert _post(app).status_code == 409
+    assert medicine_count(app) == 0
+
+
+def test_stale_pending_claim_is_taken_over(app):
+    timeout = app.config['IDEMPOTENCY_PENDING_TIMEOUT_SECONDS']
+    _insert_claim(app, created_at=datetime.utcnow() - timedelta(seconds=timeout + 5))
+
+    response = _post(app)
+    assert response.status_code == 201
+    assert 'Idempotent-Replayed' not in response.headers
+    assert medicine_count(app) == 1
+
+
+def test_claim_lost_on_every_attempt_never_runs_the_view(app, monkeypatch):
+    # The key keeps changing hands: the insert conflicts, yet the holder is gone on read
+    _insert_claim(app)
+    monkeypatch.setattr(db.session, 'get', lambda *args, **kwargs: None)
+
+    assert _post(app).status_code == 409
+    monkeypatch.undo()
+    assert medicine_count(app) == 0